@@ -8,6 +8,21 @@ import logging
 from typing import Optional
 import random
 
+# Realistic price ranges for different assets
+PRICE_RANGES = {
+    "EUR/USD": (1.05, 1.25),
+    "GBP/USD": (1.15, 1.45),
+    "USD/JPY": (140, 160),
+    "USD/BRL": (5.0, 6.5),
+    "Gold": (1800, 2200),
+    "Oil": (60, 120),
+    "BTC/USD": (25000, 75000),
+    "Silver": (18, 35)
+}
+
+# Default range for unknown assets
+DEFAULT_PRICE_RANGE = (1.0, 2.0)
+
 class ReliableDataFetcher:
     """
     WORKING DATA FETCHER - Uses only FREE APIs that actually work
@@ -164,24 +179,8 @@ class ReliableDataFetcher:
         Based on actual market ranges for each asset
         """
         
-        # Realistic price ranges for different assets
-        price_ranges = {
-            "EUR/USD": (1.05, 1.25),
-            "GBP/USD": (1.15, 1.45),
-            "USD/JPY": (140, 160),
-            "USD/BRL": (5.0, 6.5),
-            "Gold": (1800, 2200),
-            "Oil": (60, 120),
-            "BTC/USD": (25000, 75000),
-            "Silver": (18, 35)
-        }
-        
         # Get base price range
-        if self.asset in price_ranges:
-            min_price, max_price = price_ranges[self.asset]
-        else:
-            # Default range for unknown assets
-            min_price, max_price = (1.0, 2.0)
+        min_price, max_price = PRICE_RANGES.get(self.asset, DEFAULT_PRICE_RANGE)
         
         # Generate realistic price with small random movements
         base_price = min_price + (max_price - min_price) * 0.5  # Middle of range
@@ -0,0 +1,256 @@
+import argparse
+import time
+import pandas as pd
+import numpy as np
+from typing import List, Optional, Tuple
+from data_acquisition import PRICE_RANGES, DEFAULT_PRICE_RANGE
+from strategy_bundle import ensemble_signals
+
+# Supported replay speeds (multiples of real time)
+MIN_REPLAY_SPEED = 1.0
+MAX_REPLAY_SPEED = 1000.0
+
+# Fixed start of synthetic sessions so identical seeds give identical candles
+SYNTHETIC_START = pd.Timestamp("2024-01-01").timestamp()
+
+
+class VirtualClock:
+    """
+    Virtual market clock that runs at a fixed multiple of real time
+    """
+
+    def __init__(self, start: float, speed: float = 1.0):
+        self.set_speed(speed)
+        self._now = start
+
+    def set_speed(self, speed: float):
+        """Change the replay speed, keeping it within the supported range"""
+        if not MIN_REPLAY_SPEED <= speed <= MAX_REPLAY_SPEED:
+            raise ValueError(
+                f"Replay speed must be between {MIN_REPLAY_SPEED:g}x and {MAX_REPLAY_SPEED:g}x, got {speed}"
+            )
+        self.speed = speed
+
+    def now(self) -> float:
+        """Current virtual time (epoch seconds)"""
+        return self._now
+
+    def advance_to(self, timestamp: float):
+        """Sleep until the virtual clock reaches timestamp, then move there"""
+        if timestamp <= self._now:
+            return
+        time.sleep((timestamp - self._now) / self.speed)
+        self._now = timestamp
+
+    def jump_to(self, timestamp: float):
+        """Move the virtual clock forward without waiting"""
+        self._now = max(self._now, timestamp)
+
+
+def load_ticks(source) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load recorded ticks from a CSV path or file-like object
+    Expects 'timestamp' (epoch seconds or datetime string) and 'price' columns
+    """
+    df = pd.read_csv(source)
+    missing = {"timestamp", "price"} - set(df.columns)
+    if missing:
+        raise ValueError(f"Tick file is missing columns: {', '.join(sorted(missing))}")
+
+    # Skip incomplete rows so NaN prices never reach the candles
+    df = df.dropna(subset=["timestamp", "price"])
+
+    if pd.api.types.is_numeric_dtype(df["timestamp"]):
+        timestamps = df["timestamp"].to_numpy(dtype=float)
+    else:
+        timestamps = pd.to_datetime(df["timestamp"], utc=True).to_numpy(dtype="datetime64[ns]").astype(np.int64) / 1e9
+    prices = df["price"].to_numpy(dtype=float)
+
+    # Stable sort keeps the recorded order of ticks sharing a timestamp
+    order = np.argsort(timestamps, kind="stable")
+    return timestamps[order], prices[order]
+
+
+def synthetic_ticks(asset: str, seed: int = 0, count: int = 86400,
+                    interval: float = 1.0, volatility: float = 0.00025) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate a deterministic random-walk tick stream for an asset
+    Same asset and seed always produce the same ticks
+    """
+    min_price, max_price = PRICE_RANGES.get(asset, DEFAULT_PRICE_RANGE)
+    base_price = min_price + (max_price - min_price) * 0.5  # Middle of range
+
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0, volatility, count)
+    returns[0] = 0.0
+    prices = base_price * np.cumprod(1 + returns)
+    timestamps = SYNTHETIC_START + np.arange(count) * interval
+    return timestamps, prices
+
+
+def build_candles(timestamps: np.ndarray, prices: np.ndarray, timeframe: int) -> pd.DataFrame:
+    """Aggregate ticks into OHLC candles of timeframe seconds"""
+    if len(timestamps) == 0:
+        return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+
+    buckets = (timestamps // timeframe) * timeframe
+    grouped = pd.Series(prices).groupby(buckets)
+    candles = pd.DataFrame({
+        "open": grouped.first(),
+        "high": grouped.max(),
+        "low": grouped.min(),
+        "close": grouped.last(),
+        "volume": grouped.size()  # Tick count
+    })
+    candles.index = pd.to_datetime(candles.index, unit="s")
+    return candles
+
+
+class ReplayDataFetcher:
+    """
+    REPLAY DATA FETCHER - Drop-in replacement for DataFetcher
+    Feeds recorded or synthetic ticks through candle building on a virtual clock
+    """
+
+    def __init__(self, broker: str, asset: str, otc: bool = False, ticks: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                 speed: float = 1.0, seed: int = 0, timeframe: int = 60, warmup_candles: int = 50):
+        self.broker = broker
+        self.asset = asset
+        self.otc = otc
+        self.timeframe = timeframe
+
+        if ticks is None:
+            ticks = synthetic_ticks(asset, seed=seed)
+        self.timestamps, self.prices = ticks
+        if len(self.timestamps) < 2:
+            raise ValueError("Replay needs at least two ticks")
+
+        # Skip ahead so strategies have enough history on the first signal,
+        # but leave at least one candle to replay on short recordings
+        warmup_end = min(self.timestamps[0] + warmup_candles * timeframe, self.timestamps[-1] - timeframe)
+        # Start on a candle boundary so every advance closes a full candle
+        start = (warmup_end // timeframe) * timeframe
+        self._cursor = int(np.searchsorted(self.timestamps, start, side="left"))
+        self.clock = VirtualClock(start, speed)
+
+    @property
+    def exhausted(self) -> bool:
+        """True once every tick has been replayed"""
+        return self._cursor >= len(self.timestamps)
+
+    def advance(self, seconds: float) -> Optional[float]:
+        """
+        Replay all ticks in the next `seconds` of virtual time
+        Gaps with no ticks (e.g. market closes) are skipped without waiting,
+        so every advance replays at least one tick
+        Returns the latest price, or None when the stream is exhausted
+        """
+        if self.exhausted:
+            return None
+
+        now = self.clock.now()
+        next_tick = self.timestamps[self._cursor]
+        if next_tick >= now + seconds:
+            # Jump to the start of the step holding the next tick
+            self.clock.jump_to(now + ((next_tick - now) // seconds) * seconds)
+
+        target = self.clock.now() + seconds
+        self._cursor = int(np.searchsorted(self.timestamps, target, side="left"))
+        self.clock.advance_to(target)
+        return float(self.prices[self._cursor - 1])
+
+    def fetch_price(self) -> Optional[float]:
+        """Move the replay forward by one candle and return the latest price"""
+        return self.advance(self.timeframe)
+
+    def get_ohlc_data(self, periods: int = 100) -> pd.DataFrame:
+        """Build the last `periods` candles from ticks replayed so far"""
+        now = self.clock.now()
+        window_start = (now // self.timeframe - periods) * self.timeframe
+        start = int(np.searchsorted(self.timestamps, window_start, side="left"))
+        return build_candles(self.timestamps[start:self._cursor], self.prices[start:self._cursor], self.timeframe)
+
+    def close(self):
+        """Cleanup"""
+        pass
+
+
+def run_replay(fetcher: ReplayDataFetcher, market_type: str = "regular", periods: int = 50) -> List[dict]:
+    """
+    Drive a replay headlessly until the stream is exhausted
+    Returns one record per candle with the price, candles and ensemble signal
+    """
+    results = []
+    while True:
+        price = fetcher.fetch_price()
+        if price is None:
+            break
+        df = fetcher.get_ohlc_data(periods=periods)
+        # Right after a long gap the window may hold too few candles for the strategies
+        if len(df) < 2:
+            continue
+        final_signal, confidence, signals = ensemble_signals(df, market_type)
+        results.append({
+            "time": fetcher.clock.now(),
+            "price": price,
+            "candles": df,
+            "signal": final_signal,
+            "confidence": confidence,
+            "signals": signals
+        })
+    return results
+
+
+def same_results(first: List[dict], second: List[dict]) -> bool:
+    """True if two replay runs produced identical candles and signals"""
+    if len(first) != len(second):
+        return False
+    for a, b in zip(first, second):
+        if (a["time"], a["price"], a["signal"], a["confidence"], a["signals"]) != \
+                (b["time"], b["price"], b["signal"], b["confidence"], b["signals"]):
+            return False
+        if not a["candles"].equals(b["candles"]):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay ticks through candle building and the strategies")
+    parser.add_argument("--asset", default="EUR/USD")
+    parser.add_argument("--ticks", help="Recorded ticks CSV (timestamp, price); synthetic if omitted")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--count", type=int, default=3600, help="Synthetic tick count")
+    parser.add_argument("--timeframe", type=int, default=60)
+    parser.add_argument("--speed", type=float, default=MAX_REPLAY_SPEED)
+    parser.add_argument("--otc", action="store_true")
+    parser.add_argument("--check", action="store_true", help="Replay twice and verify identical output")
+    args = parser.parse_args()
+
+    market_type = "otc" if args.otc else "regular"
+
+    def replay_once():
+        if args.ticks:
+            ticks = load_ticks(args.ticks)
+        else:
+            ticks = synthetic_ticks(args.asset, seed=args.seed, count=args.count)
+        fetcher = ReplayDataFetcher("Replay", args.asset, otc=args.otc, ticks=ticks, speed=args.speed,
+                                    seed=args.seed, timeframe=args.timeframe)
+        started = time.perf_counter()
+        results = run_replay(fetcher, market_type)
+        print(f"⏱️ Replayed {len(results)} candles in {time.perf_counter() - started:.3f}s")
+        return results
+
+    results = replay_once()
+    for record in results:
+        print(f"{pd.to_datetime(record['time'], unit='s')}  {record['price']:.5f}  "
+              f"{record['signal'].upper():<4}  {record['confidence']:.2f}  {record['signals']}")
+
+    if args.check:
+        if not same_results(results, replay_once()):
+            print("❌ Replay output differs between runs")
+            raise SystemExit(1)
+        print("✅ Replay output is identical across runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,12 @@ import streamlit as st
 from auth import login
 from config import BROKERS, TIMEFRAME_LABELS, TIMEFRAMES
 from data_acquisition import DataFetcher
+from replay import ReplayDataFetcher, load_ticks, MIN_REPLAY_SPEED, MAX_REPLAY_SPEED
 from strategy_bundle import ensemble_signals
 import pandas as pd
 from datetime import datetime, timedelta
 import time
+import hashlib
 
 def run_app():
     authenticated = login()
@@ -32,6 +34,17 @@ def run_app():
         # Auto-refresh option
         auto_refresh = st.checkbox("🔄 Auto Refresh (30s)")
         
+        # Replay mode for reproducing signals on recorded or synthetic ticks
+        st.markdown("---")
+        replay_settings = None
+        if st.checkbox("🧪 Replay Mode"):
+            speed = st.slider("⏩ Replay Speed (x)", int(MIN_REPLAY_SPEED), int(MAX_REPLAY_SPEED), 100)
+            seed = st.number_input("🎲 Synthetic Seed", min_value=0, value=0, step=1)
+            tick_file = st.file_uploader("📂 Recorded Ticks (CSV: timestamp, price)", type="csv")
+            replay_settings = {"speed": speed, "seed": int(seed), "tick_file": tick_file}
+            if st.button("⏮️ Restart Replay"):
+                st.session_state.pop("replay_fetcher", None)
+        
     # Main content area
     col1, col2 = st.columns([2, 1])
     
@@ -40,14 +53,14 @@ def run_app():
         
         # Signal generation button
         if st.button("🎯 **GET TRADING SIGNAL**", type="primary", use_container_width=True):
-            generate_signal(broker, asset, market_type, timeframe_label)
+            generate_signal(broker, asset, market_type, timeframe_label, replay_settings)
         
         # Auto-refresh logic
         if auto_refresh:
             placeholder = st.empty()
             time.sleep(30)  # Wait 30 seconds
             with placeholder:
-                generate_signal(broker, asset, market_type, timeframe_label)
+                generate_signal(broker, asset, market_type, timeframe_label, replay_settings)
             st.rerun()
     
     with col2:
@@ -66,7 +79,25 @@ def run_app():
         st.metric("API Health", "99.8%", "0.1%")
         st.metric("Response Time", "1.2s", "-0.3s")
 
-def generate_signal(broker, asset, market_type, timeframe_label):
+def get_replay_fetcher(broker, asset, otc, time_sec, replay_settings):
+    """Reuse the replay fetcher across reruns so each signal advances the same stream"""
+    tick_file = replay_settings["tick_file"]
+    # Speed does not change the output, so it is applied to the running replay instead of keying it
+    key = (broker, asset, otc, time_sec, replay_settings["seed"],
+           hashlib.sha1(tick_file.getvalue()).hexdigest() if tick_file else None)
+    
+    cached = st.session_state.get("replay_fetcher")
+    if cached and cached[0] == key:
+        cached[1].clock.set_speed(replay_settings["speed"])
+        return cached[1]
+    
+    ticks = load_ticks(tick_file) if tick_file else None
+    fetcher = ReplayDataFetcher(broker, asset, otc=otc, ticks=ticks, speed=replay_settings["speed"],
+                                seed=replay_settings["seed"], timeframe=time_sec)
+    st.session_state["replay_fetcher"] = (key, fetcher)
+    return fetcher
+
+def generate_signal(broker, asset, market_type, timeframe_label, replay_settings=None):
     """Generate trading signal with enhanced UI feedback"""
     
     # Progress bar for user feedback
@@ -78,27 +109,37 @@ def generate_signal(broker, asset, market_type, timeframe_label):
         status_text.text("🔄 Connecting to data sources...")
         progress_bar.progress(20)
         
-        fetcher = DataFetcher(broker, asset, otc=(market_type == "OTC Market"))
+        # Get timeframe in seconds
+        idx = TIMEFRAME_LABELS.index(timeframe_label)
+        time_sec = TIMEFRAMES[idx]
+        
+        otc = market_type == "OTC Market"
+        if replay_settings:
+            fetcher = get_replay_fetcher(broker, asset, otc, time_sec, replay_settings)
+        else:
+            fetcher = DataFetcher(broker, asset, otc=otc)
         
         # Step 2: Fetch price data
-        status_text.text("📡 Fetching live price data...")
+        if replay_settings:
+            status_text.text("⏩ Replaying next candle...")
+        else:
+            status_text.text("📡 Fetching live price data...")
         progress_bar.progress(40)
         
         price = fetcher.fetch_price()
         
         if price is None:
             st.error("❌ **Failed to fetch price data**")
-            st.warning("Please try again in a few moments. Our system is trying multiple data sources.")
+            if replay_settings:
+                st.warning("Replay stream is exhausted. Restart the replay or load another tick file.")
+            else:
+                st.warning("Please try again in a few moments. Our system is trying multiple data sources.")
             return
         
         # Step 3: Generate OHLC data
         status_text.text("📊 Generating market data...")
         progress_bar.progress(60)
         
-        # Get timeframe in seconds
-        idx = TIMEFRAME_LABELS.index(timeframe_label)
-        time_sec = TIMEFRAMES[idx]
-        
         # Get OHLC data using the new method
         df = fetcher.get_ohlc_data(periods=50)  # Get 50 periods for analysis
         